@@ -0,0 +1,15 @@
+"""Process-wide warning and logging setup for the Lunef agents.
+
+Import this before spoon_ai so its noisy loggers are quieted from the start.
+Module import caching makes it run exactly once per process.
+"""
+
+import logging
+import os
+import warnings
+
+warnings.filterwarnings("ignore", category=DeprecationWarning)
+warnings.filterwarnings("ignore", message=".*non-text parts.*")
+logging.getLogger("spoon_ai").setLevel(logging.ERROR)
+logging.getLogger("google").setLevel(logging.ERROR)
+os.environ["GRPC_VERBOSITY"] = "ERROR"
@@ -58,4 +58,10 @@ async def main():
 
 
 if __name__ == "__main__":
-    result = asyncio.run(main())
+    # uvloop is faster for socket-heavy workloads; not available on Windows
+    try:
+        import uvloop
+    except ImportError:
+        result = asyncio.run(main())
+    else:
+        result = uvloop.run(main())
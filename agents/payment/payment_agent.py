@@ -1,7 +1,14 @@
 """Payment agent for processing voice payment intents."""
 
+# Quiet warnings and loggers before spoon_ai is imported
+from agents import _bootstrap  # noqa: F401
+
+import asyncio
+import copy
 import json
+import logging
 import re
+from decimal import Decimal, InvalidOperation
 from typing import Optional
 
 from spoon_ai.agents.toolcall import ToolCallAgent
@@ -13,8 +20,36 @@ from tools import (
     FXConversionTool,
     BalanceCheckTool,
     PaymentPreviewTool,
+    PaymentPrepareTool,
     PaymentExecuteTool,
     VideoGenerationTool,
+    VideoBatchGenerationTool,
+    aclose,
+    warmup,
+)
+
+from .plan_cache import PlanCache, PlanKey, classify
+
+logger = logging.getLogger(__name__)
+
+_UUID_RE = re.compile(
+    r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}",
+    re.IGNORECASE,
+)
+
+_PREVIEW_KEY_RE = re.compile(r'"preview_id"\s*:\s*"([0-9a-f-]{36})"', re.IGNORECASE)
+
+# Confirmation phrases, word-bounded so "yesterday" doesn't count as "yes"
+_CONFIRM_RE = re.compile(
+    r"\b(?:yes|yeah|yep|yup|confirm(?:ed)?|do it|send it|go ahead|proceed|approve"
+    r"|that'?s right|correct|ok(?:ay)?|sure)\b",
+    re.IGNORECASE,
+)
+
+# Cancellation phrases
+_CANCEL_RE = re.compile(
+    r"\b(?:no|nope|cancel(?:led)?|stop|wait|don'?t|abort|never ?mind|hold on)\b",
+    re.IGNORECASE,
 )
 
 
@@ -52,17 +87,18 @@ IMPORTANT RULES:
 
 PAYMENT FLOW:
 1. When user says "send X pounds to @someone":
-   a. Use resolve_tag to get the recipient's address
-   b. Use convert_fiat_to_gas to get the GAS amount
-   c. Use check_balance to verify sufficient funds
-   d. Use create_payment_preview to show the user what will happen
-   e. Wait for confirmation before using execute_payment
+   a. Use prepare_payment with the tag, amount and currency - it resolves the
+      recipient, converts to GAS, checks the balance and creates the preview in one step
+   b. If prepare_payment reports it is not available, do the steps individually:
+      resolve_tag, convert_fiat_to_gas, check_balance, then create_payment_preview
+   c. Wait for confirmation before using execute_payment
 
 2. For balance checks:
    - Use check_balance and report in both GAS and fiat equivalent
 
 3. For video generation:
    - Use generate_video with the user's prompt
+   - For several videos at once, use generate_videos_batch with all the prompts
    - Explain the cost before proceeding
 
 VOICE CONFIRMATION PHRASES:
@@ -73,12 +109,15 @@ Always be friendly, clear, and security-conscious. If something seems suspicious
 
     # Tool manager with all payment tools
     avaliable_tools: ToolManager = ToolManager([
+        PaymentPrepareTool(),
+        # Per-step fallback while /payments/prepare isn't deployed everywhere
         TagResolverTool(),
         FXConversionTool(),
-        BalanceCheckTool(),
         PaymentPreviewTool(),
+        BalanceCheckTool(),
         PaymentExecuteTool(),
         VideoGenerationTool(),
+        VideoBatchGenerationTool(),
     ])
 
     def __init__(self, user_id: str, llm: Optional[ChatBot] = None):
@@ -90,6 +129,9 @@ Always be friendly, clear, and security-conscious. If something seems suspicious
         """
         self.user_id = user_id
         self.pending_preview_id: Optional[str] = None
+        self.plan_cache = PlanCache()
+        self._pending_plan: Optional[PlanKey] = None
+        self._exec_task: Optional[asyncio.Task] = None
 
         # Use provided LLM or create default
         if llm is None:
@@ -100,6 +142,43 @@ Always be friendly, clear, and security-conscious. If something seems suspicious
 
         super().__init__(llm=llm)
 
+        # Reuse tool instances rather than constructing (and validating) one per call
+        self._execute_tool = self.avaliable_tools.get_tool("execute_payment")
+        self._balance_tool = self.avaliable_tools.get_tool("check_balance")
+        self._tag_tool = self.avaliable_tools.get_tool("resolve_tag")
+        self._fx_tool = self.avaliable_tools.get_tool("convert_fiat_to_gas")
+        self._preview_tool = self.avaliable_tools.get_tool("create_payment_preview")
+
+        # Warm caches in the background; deferred to the first turn without a running loop
+        self._warm_task: Optional[asyncio.Task] = None
+        self._start_warmup()
+
+    async def warm(self) -> None:
+        """Prefetch the user's balance and FX rates for all supported currencies.
+
+        Runs while the user is still speaking, so the first payment turn finds
+        the FX rate cache populated and backend connections already open.
+        Failures are only logged; the real request will surface them.
+        """
+        results = await asyncio.gather(
+            warmup(),
+            self._balance_tool.execute(user_id=self.user_id),
+            *(self._fx_tool.execute(1.0, currency) for currency in ("GBP", "EUR", "USD", "CHF")),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                logger.debug("Warmup prefetch failed: %r", result)
+
+    def _start_warmup(self) -> None:
+        """Schedule warm() as a background task if an event loop is running."""
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return
+
+        self._warm_task = asyncio.create_task(self.warm())
+
     async def process_voice_input(self, transcript: str) -> dict:
         """Process voice input and return response.
 
@@ -112,6 +191,26 @@ Always be friendly, clear, and security-conscious. If something seems suspicious
             - action: Optional action type (preview, confirmed, cancelled, etc.)
             - data: Optional action-specific data
         """
+        if self._warm_task is None:
+            self._start_warmup()
+
+        # A payment is being executed; only a cancellation is meaningful now
+        if self._exec_task is not None and not self._exec_task.done():
+            if self._check_confirmation(transcript) == "cancelled":
+                self._exec_task.cancel()
+                return {
+                    "response": (
+                        "Stopping the payment. It may already have been broadcast, "
+                        "so please check your transaction history."
+                    ),
+                    "action": "cancelled",
+                }
+
+            return {
+                "response": "Your payment is still being processed.",
+                "action": "processing",
+            }
+
         # Check if this is a confirmation for a pending payment
         if self.pending_preview_id:
             confirmation_status = self._check_confirmation(transcript)
@@ -122,7 +221,11 @@ Always be friendly, clear, and security-conscious. If something seems suspicious
                 return result
 
             elif confirmation_status == "cancelled":
+                # A declined preview must not be replayed from the plan cache
                 self.pending_preview_id = None
+                if self._pending_plan is not None:
+                    self.plan_cache.invalidate(self._pending_plan)
+                    self._pending_plan = None
                 return {
                     "response": "Payment cancelled. Is there anything else I can help you with?",
                     "action": "cancelled",
@@ -134,6 +237,11 @@ Always be friendly, clear, and security-conscious. If something seems suspicious
                 "action": "awaiting_confirmation",
             }
 
+        # Known intents have a fixed tool sequence and skip the LLM entirely
+        plan = classify(transcript)
+        if plan is not None:
+            return await self._run_plan(plan)
+
         # Process new intent
         response = await self.run(
             f"User ID: {self.user_id}\nUser says: {transcript}"
@@ -157,6 +265,144 @@ Always be friendly, clear, and security-conscious. If something seems suspicious
             "action": "info",
         }
 
+    async def _run_plan(self, plan: PlanKey) -> dict:
+        """Run the fixed tool sequence for a recognised intent.
+
+        Args:
+            plan: Canonical intent from classify()
+
+        Returns:
+            Response dictionary in the same shape as process_voice_input
+        """
+        if plan.intent == "check_balance":
+            return await self._fast_balance()
+
+        cached = self.plan_cache.get(plan)
+        if cached is not None:
+            self.pending_preview_id = cached["data"]["preview_id"]
+            self._pending_plan = plan
+            # Callers may modify the response; keep the cached one intact
+            return copy.deepcopy(cached)
+
+        result = await self._fast_payment_preview(plan.tag, plan.amount, plan.currency)
+        if result["action"] == "preview":
+            self._pending_plan = plan
+            self.plan_cache.put(plan, copy.deepcopy(result))
+
+        return result
+
+    async def _fast_balance(self) -> dict:
+        """Report the user's balance without going through the LLM.
+
+        Returns:
+            Response dictionary in the same shape as process_voice_input
+        """
+        balance = json.loads(await self._balance_tool.execute(user_id=self.user_id))
+
+        if "error" in balance:
+            return {
+                "response": balance["error"],
+                "action": "error",
+            }
+
+        return {
+            "response": (
+                f"Your balance is {balance['gas_balance']} GAS, "
+                f"about {balance['fiat_equivalent']} {balance['fiat_currency']}."
+            ),
+            "action": "info",
+            "data": balance,
+        }
+
+    async def _prepare_payment(self, tag: str, amount: float, currency: str) -> dict:
+        """Resolve the recipient, convert the amount and check the balance.
+
+        The three lookups are independent, so they run concurrently instead
+        of one after another.
+
+        Args:
+            tag: Recipient's @tag
+            amount: Fiat amount to send
+            currency: Fiat currency code
+
+        Returns:
+            Dictionary with the decoded "recipient", "conversion" and "balance" results
+        """
+        tag_result, fx_result, balance_result = await asyncio.gather(
+            self._tag_tool.execute(tag),
+            self._fx_tool.execute(amount, currency),
+            self._balance_tool.execute(user_id=self.user_id),
+        )
+
+        return {
+            "recipient": json.loads(tag_result),
+            "conversion": json.loads(fx_result),
+            "balance": json.loads(balance_result),
+        }
+
+    async def _fast_payment_preview(self, tag: str, amount: float, currency: str) -> dict:
+        """Create a payment preview without going through the LLM.
+
+        Args:
+            tag: Recipient's @tag
+            amount: Fiat amount to send
+            currency: Fiat currency code
+
+        Returns:
+            Response dictionary in the same shape as process_voice_input
+        """
+        prepared = await self._prepare_payment(tag, amount, currency)
+
+        for result in prepared.values():
+            if "error" in result:
+                return {
+                    "response": result["error"],
+                    "action": "error",
+                }
+
+        recipient = prepared["recipient"]
+        conversion = prepared["conversion"]
+        balance = prepared["balance"]
+
+        try:
+            insufficient = Decimal(conversion["gas_amount"]) > Decimal(balance["gas_balance"])
+        except (InvalidOperation, KeyError):
+            # Let the backend decide when the amounts can't be compared locally
+            insufficient = False
+
+        if insufficient:
+            return {
+                "response": (
+                    f"You don't have enough GAS for this payment. "
+                    f"Your balance is {balance['gas_balance']} GAS."
+                ),
+                "action": "error",
+            }
+
+        preview_str = await self._preview_tool.execute(
+            user_id=self.user_id,
+            to_address=recipient["address"],
+            to_tag=recipient["tag"],
+            amount_gas=conversion["gas_amount"],
+            fiat_amount=amount,
+            fiat_currency=currency,
+        )
+        preview = json.loads(preview_str)
+
+        if "error" in preview:
+            return {
+                "response": preview["error"],
+                "action": "error",
+            }
+
+        self.pending_preview_id = preview.get("preview_id")
+
+        return {
+            "response": preview["confirmation_message"],
+            "action": "preview",
+            "data": {"preview_id": self.pending_preview_id},
+        }
+
     def _check_confirmation(self, transcript: str) -> str:
         """Check if transcript is a confirmation or cancellation.
 
@@ -166,28 +412,14 @@ Always be friendly, clear, and security-conscious. If something seems suspicious
         Returns:
             "confirmed", "cancelled", or "unclear"
         """
-        transcript_lower = transcript.lower().strip()
-
-        # Confirmation phrases
-        confirm_phrases = [
-            "yes", "yeah", "yep", "yup", "confirm", "confirmed",
-            "do it", "send it", "go ahead", "proceed", "approve",
-            "that's right", "correct", "ok", "okay", "sure",
-        ]
+        transcript = transcript.strip()
 
-        # Cancellation phrases
-        cancel_phrases = [
-            "no", "nope", "cancel", "stop", "wait", "don't",
-            "abort", "nevermind", "never mind", "hold on",
-        ]
+        # Cancellation wins: "don't do it" and "ok cancel" contain confirm words too
+        if _CANCEL_RE.search(transcript):
+            return "cancelled"
 
-        for phrase in confirm_phrases:
-            if phrase in transcript_lower:
-                return "confirmed"
-
-        for phrase in cancel_phrases:
-            if phrase in transcript_lower:
-                return "cancelled"
+        if _CONFIRM_RE.search(transcript):
+            return "confirmed"
 
         return "unclear"
 
@@ -200,21 +432,15 @@ Always be friendly, clear, and security-conscious. If something seems suspicious
         Returns:
             Preview ID if found, None otherwise
         """
-        # Look for UUID pattern
-        uuid_pattern = r'[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}'
-        match = re.search(uuid_pattern, response, re.IGNORECASE)
+        # Preview JSON returned by create_payment_preview
+        match = _PREVIEW_KEY_RE.search(response)
         if match:
-            return match.group(0)
+            return match.group(1)
 
-        # Look for preview_id in JSON
-        try:
-            if "{" in response:
-                json_match = re.search(r'\{[^}]+\}', response)
-                if json_match:
-                    data = json.loads(json_match.group(0))
-                    return data.get("preview_id")
-        except json.JSONDecodeError:
-            pass
+        # Any UUID mentioned in the response text
+        match = _UUID_RE.search(response)
+        if match:
+            return match.group(0)
 
         return None
 
@@ -230,53 +456,55 @@ Always be friendly, clear, and security-conscious. If something seems suspicious
                 "action": "error",
             }
 
-        # Use the execute_payment tool
-        execute_tool = PaymentExecuteTool()
-        result_str = await execute_tool.execute(
-            user_id=self.user_id,
-            preview_id=self.pending_preview_id,
-        )
+        preview_id = self.pending_preview_id
 
-        # Clear pending preview
+        # Clear pending preview; an executed preview can't be reused
         self.pending_preview_id = None
+        if self._pending_plan is not None:
+            self.plan_cache.invalidate(self._pending_plan)
+            self._pending_plan = None
 
+        # Run as a separate task so a "cancel" turn can abort it mid-flight
+        self._exec_task = asyncio.create_task(
+            self._execute_tool.execute_typed(user_id=self.user_id, preview_id=preview_id)
+        )
         try:
-            result = json.loads(result_str)
+            result = await asyncio.shield(self._exec_task)
+        except asyncio.CancelledError:
+            if not self._exec_task.cancelled():
+                raise
+            return {
+                "response": "Payment execution was stopped. Please check your transaction history.",
+                "action": "cancelled",
+            }
 
-            if result.get("success"):
-                return {
-                    "response": result.get("confirmation_message", "Payment sent successfully!"),
-                    "action": "confirmed",
-                    "data": {
-                        "tx_hash": result.get("tx_hash"),
-                        "explorer_url": result.get("explorer_url"),
-                    },
-                }
-            else:
-                return {
-                    "response": f"Payment failed: {result.get('error', 'Unknown error')}",
-                    "action": "error",
-                    "data": result,
-                }
+        if result.get("success"):
+            return {
+                "response": result.get("confirmation_message", "Payment sent successfully!"),
+                "action": "confirmed",
+                "data": {
+                    "tx_hash": result.get("tx_hash"),
+                    "explorer_url": result.get("explorer_url"),
+                },
+            }
 
-        except json.JSONDecodeError:
+        if "warning" in result:
             return {
                 "response": "Payment status unclear. Please check your transaction history.",
                 "action": "error",
+                "data": result,
             }
 
+        return {
+            "response": f"Payment failed: {result.get('error', 'Unknown error')}",
+            "action": "error",
+            "data": result,
+        }
+
 
 # Example usage
 async def main():
     """Example of using the PaymentAgent."""
-    import os
-
-    # Suppress warnings
-    import warnings
-    import logging
-    warnings.filterwarnings("ignore")
-    logging.getLogger("spoon_ai").setLevel(logging.ERROR)
-    os.environ["GRPC_VERBOSITY"] = "ERROR"
 
     # Create agent for a user
     user_id = "550e8400-e29b-41d4-a716-446655440000"  # Example UUID
@@ -285,20 +513,29 @@ async def main():
     # Process voice inputs
     print("Testing PaymentAgent...")
 
-    # Test 1: Check balance
-    result = await agent.process_voice_input("What's my balance?")
-    print(f"Balance check: {result['response']}")
+    try:
+        # Test 1: Check balance
+        result = await agent.process_voice_input("What's my balance?")
+        print(f"Balance check: {result['response']}")
 
-    # Test 2: Send payment
-    result = await agent.process_voice_input("Send 200 pounds to @alice")
-    print(f"Payment request: {result['response']}")
+        # Test 2: Send payment
+        result = await agent.process_voice_input("Send 200 pounds to @alice")
+        print(f"Payment request: {result['response']}")
 
-    # Test 3: Confirm payment (if preview was created)
-    if result.get("action") == "preview":
-        result = await agent.process_voice_input("Yes, confirm")
-        print(f"Confirmation: {result['response']}")
+        # Test 3: Confirm payment (if preview was created)
+        if result.get("action") == "preview":
+            result = await agent.process_voice_input("Yes, confirm")
+            print(f"Confirmation: {result['response']}")
+    finally:
+        # Release pooled backend connections before the loop shuts down
+        await aclose()
 
 
 if __name__ == "__main__":
-    import asyncio
-    asyncio.run(main())
+    # uvloop is faster for socket-heavy workloads; not available on Windows
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
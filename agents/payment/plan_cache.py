@@ -0,0 +1,136 @@
+"""Plan cache for routing recurring voice intents without the LLM."""
+
+import re
+import time
+from functools import lru_cache
+from typing import NamedTuple, Optional
+
+# Whole-utterance send commands: "send 200 pounds to @alice", "pay £50 to @bob".
+# Anything extra ("...and make it a birthday gift"), or an amount with more
+# than two decimals, is left to the LLM.
+_SEND_RE = re.compile(
+    r"^\s*(?:send|pay|transfer)\s+"
+    r"(?:(?P<symbol>[£€$])\s*(?P<symbol_amount>\d+(?:\.\d{1,2})?)"
+    r"|(?P<amount>\d+(?:\.\d{1,2})?)\s*"
+    r"(?P<currency>pounds?|quid|gbp|euros?|eur|dollars?|bucks?|usd|francs?|chf))"
+    r"\s+(?:to\s+)?@(?P<tag>\w+)[\s.!?]*$",
+    re.IGNORECASE,
+)
+
+# Plain balance questions like "what's my balance?" or "check my balance"
+_BALANCE_RE = re.compile(
+    r"^\s*(?:what'?s|what is|check|show|tell me)\s+(?:my\s+)?(?:wallet\s+)?balance\W*$",
+    re.IGNORECASE,
+)
+
+# Spoken currency names and symbols -> ISO code (plural "s" stripped first)
+_CUR_MAP = {
+    "£": "GBP",
+    "pound": "GBP",
+    "quid": "GBP",
+    "gbp": "GBP",
+    "€": "EUR",
+    "euro": "EUR",
+    "eur": "EUR",
+    "$": "USD",
+    "dollar": "USD",
+    "buck": "USD",
+    "usd": "USD",
+    "franc": "CHF",
+    "chf": "CHF",
+}
+
+
+class PlanKey(NamedTuple):
+    """Canonical form of a voice intent: what to do, to whom, how much."""
+
+    intent: str
+    tag: Optional[str] = None
+    currency: Optional[str] = None
+    amount: Optional[float] = None
+
+
+@lru_cache(maxsize=1024)
+def _classify(normalized: str) -> Optional[PlanKey]:
+    match = _SEND_RE.match(normalized)
+    if match:
+        if match["symbol"]:
+            currency = _CUR_MAP[match["symbol"]]
+            amount = match["symbol_amount"]
+        else:
+            currency = _CUR_MAP[match["currency"].lower().rstrip("s")]
+            amount = match["amount"]
+        value = float(amount)
+        if value <= 0:
+            return None
+        # Keep whole amounts integral so messages say "200 GBP", not "200.0 GBP"
+        return PlanKey("send", match["tag"], currency, int(value) if value.is_integer() else value)
+
+    if _BALANCE_RE.match(normalized):
+        return PlanKey("check_balance")
+
+    return None
+
+
+def classify(transcript: str) -> Optional[PlanKey]:
+    """Map a transcript to a canonical plan key.
+
+    Transcripts are normalized (case and whitespace) before lookup, so
+    repeated utterances hit the LRU instead of re-running the regexes.
+
+    Args:
+        transcript: The transcribed voice input
+
+    Returns:
+        PlanKey for intents with a fixed tool sequence, None otherwise
+    """
+    return _classify(" ".join(transcript.lower().split()))
+
+
+class PlanCache:
+    """Per-user cache of payment previews keyed by canonical intent.
+
+    Previews expire after a short TTL since the backend quote and the
+    user's balance can move underneath them.
+    """
+
+    def __init__(self, preview_ttl: float = 30.0):
+        self.preview_ttl = preview_ttl
+        self._previews: dict[PlanKey, tuple[dict, float]] = {}
+
+    def get(self, key: PlanKey) -> Optional[dict]:
+        """Return a cached preview response if it hasn't expired.
+
+        Args:
+            key: The canonical plan key
+
+        Returns:
+            Cached response dictionary, or None on miss
+        """
+        entry = self._previews.get(key)
+        if entry is None:
+            return None
+
+        result, expires_at = entry
+        if time.monotonic() >= expires_at:
+            self._previews.pop(key, None)
+            return None
+
+        return result
+
+    def put(self, key: PlanKey, result: dict) -> None:
+        """Store a preview response under its plan key.
+
+        Args:
+            key: The canonical plan key
+            result: Response dictionary returned to the caller
+        """
+        self._previews[key] = (result, time.monotonic() + self.preview_ttl)
+
+    def invalidate(self, key: PlanKey) -> None:
+        """Drop a cached preview, e.g. once it has been executed.
+
+        Args:
+            key: The canonical plan key
+        """
+        self._previews.pop(key, None)
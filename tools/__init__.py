@@ -4,14 +4,22 @@ from .tag_resolver import TagResolverTool
 from .fx_conversion import FXConversionTool
 from .balance_check import BalanceCheckTool
 from .payment_preview import PaymentPreviewTool
+from .payment_prepare import PaymentPrepareTool
 from .payment_execute import PaymentExecuteTool
 from .video_generation import VideoGenerationTool
+from .video_batch_generation import VideoBatchGenerationTool
+from ._http import BACKEND_URL, aclose, warmup
 
 __all__ = [
     "TagResolverTool",
     "FXConversionTool",
     "BalanceCheckTool",
     "PaymentPreviewTool",
+    "PaymentPrepareTool",
     "PaymentExecuteTool",
     "VideoGenerationTool",
+    "VideoBatchGenerationTool",
+    "BACKEND_URL",
+    "aclose",
+    "warmup",
 ]
@@ -0,0 +1,37 @@
+"""Lightweight tool base class without pydantic model overhead."""
+
+from abc import ABC, abstractmethod
+from typing import Any
+
+
+class LightTool(ABC):
+    """Plain-class stand-in for spoon_ai's BaseTool.
+
+    ToolCallAgent and ToolManager only read name/description/parameters,
+    call to_param() and await the tool, so stateless tools don't need a
+    pydantic model. Subclasses declare these as class attributes and set
+    __slots__ so instances carry no per-instance dict.
+    """
+
+    __slots__ = ()
+
+    name: str
+    description: str
+    parameters: dict
+
+    async def __call__(self, *args, **kwargs) -> Any:
+        return await self.execute(*args, **kwargs)
+
+    @abstractmethod
+    async def execute(self, *args, **kwargs) -> Any:
+        raise NotImplementedError("Subclasses must implement this method")
+
+    def to_param(self) -> dict:
+        return {
+            "type": "function",
+            "function": {
+                "name": self.name,
+                "description": self.description,
+                "parameters": self.parameters,
+            },
+        }
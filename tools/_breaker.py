@@ -0,0 +1,52 @@
+"""Circuit breaker for backends that signal overload."""
+
+import random
+import time
+from typing import Optional
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Read a Retry-After header given in seconds; HTTP dates are ignored."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        return None
+
+
+class CircuitBreaker:
+    """Fails fast after repeated overload responses from a backend.
+
+    After `threshold` consecutive failures the breaker opens for `ttl`
+    seconds, doubling (up to 16x, with jitter) each time it re-trips
+    without a success in between. Once the cool-off passes, calls are let
+    through again (there is no single half-open probe, so concurrent callers
+    all proceed); the next failure re-opens it straight away, a success
+    closes it.
+    """
+
+    __slots__ = ("threshold", "ttl", "_failures", "_trips", "_open_until")
+
+    def __init__(self, threshold: int = 5, ttl: float = 30.0):
+        self.threshold = threshold
+        self.ttl = ttl
+        self._failures = 0
+        self._trips = 0
+        self._open_until = 0.0
+
+    def remaining(self) -> float:
+        """Seconds until calls are allowed again, 0 if the breaker is closed."""
+        return max(0.0, self._open_until - time.monotonic())
+
+    def record_success(self) -> None:
+        self._failures = 0
+        self._trips = 0
+
+    def record_failure(self) -> None:
+        """Count a failure, opening the breaker once the threshold is hit."""
+        self._failures += 1
+        if self._failures >= self.threshold:
+            cool_off = self.ttl * (1 << min(self._trips, 4))
+            self._open_until = max(self._open_until, time.monotonic() + cool_off * random.uniform(1.0, 1.1))
+            self._trips += 1
@@ -0,0 +1,63 @@
+"""Shared HTTP client for talking to the Lunef backend."""
+
+import os
+from importlib.util import find_spec
+from typing import Optional
+
+import httpx
+
+BACKEND_URL = os.getenv("LUNEF_BACKEND_URL", "http://localhost:8080")
+
+# Multiplex concurrent requests (e.g. parallel video jobs) over one connection.
+# Needs the h2 package; fall back to HTTP/1.1 pooling if it isn't installed.
+HTTP2 = os.getenv("LUNEF_HTTP2", "1") != "0" and find_spec("h2") is not None
+
+_client: Optional[httpx.AsyncClient] = None
+
+
+def get_client() -> httpx.AsyncClient:
+    """Return the shared backend client, creating it on first use.
+
+    All tools hit the same origin, so a single pooled client keeps
+    connections alive across tool calls instead of paying for a new
+    TCP/TLS handshake on every invocation. With HTTP/2 enabled, concurrent
+    calls share streams on one connection rather than queueing per socket.
+
+    Returns:
+        The process-wide httpx.AsyncClient
+    """
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            base_url=BACKEND_URL,
+            timeout=15.0,
+            # Idle connections outlive the gaps between voice turns
+            limits=httpx.Limits(
+                max_keepalive_connections=50,
+                max_connections=100,
+                keepalive_expiry=60.0,
+            ),
+            http2=HTTP2,
+        )
+    return _client
+
+
+async def warmup() -> None:
+    """Open a backend connection ahead of the first real request.
+
+    Pays DNS, TCP and TLS setup up front with a cheap health check, so the
+    first user-facing call goes straight to the backend. Failures are
+    ignored; the real request will surface them.
+    """
+    try:
+        await get_client().get("/healthz", timeout=5.0)
+    except httpx.HTTPError:
+        pass
+
+
+async def aclose() -> None:
+    """Close the shared backend client and release pooled connections."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
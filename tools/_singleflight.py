@@ -0,0 +1,69 @@
+"""Request coalescing for identical in-flight backend calls."""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Hashable
+
+# Completed results stay shared this long, so repeats within one voice
+# turn coalesce while later sessions still get fresh data
+_LINGER_SECONDS = 0.5
+
+
+class _LeaderCancelled(Exception):
+    """Set on a shared future when the caller running the request is cancelled."""
+
+
+def _evict(table: dict, key: Hashable, future: asyncio.Future) -> None:
+    if table.get(key) is future:
+        del table[key]
+
+
+async def singleflight(
+    key: Hashable,
+    coro_factory: Callable[[], Awaitable[Any]],
+    table: dict,
+) -> Any:
+    """Run coro_factory() once for concurrent callers sharing the same key.
+
+    The first caller for a key runs the call; everyone else arriving while
+    it is in flight (or within the linger window after) awaits the same
+    result instead of issuing a duplicate request. If the leading caller is
+    cancelled, a waiting caller takes over and issues the request itself.
+
+    Args:
+        key: Identifies equivalent requests, e.g. ("balance", user_id)
+        coro_factory: Zero-argument callable returning the coroutine to run
+        table: Per-module dict holding in-flight futures
+
+    Returns:
+        The result of the shared call
+    """
+    # Followers retry if the leader is cancelled; one of them takes over
+    while (future := table.get(key)) is not None:
+        try:
+            return await asyncio.shield(future)
+        except _LeaderCancelled:
+            continue
+
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+    table[key] = future
+
+    try:
+        result = await coro_factory()
+    except asyncio.CancelledError:
+        # Only the leader was cancelled; let followers retry rather than
+        # propagating a cancellation nobody asked them for
+        table.pop(key, None)
+        future.set_exception(_LeaderCancelled())
+        future.exception()
+        raise
+    except Exception as e:
+        table.pop(key, None)
+        future.set_exception(e)
+        # Mark as retrieved so a failure nobody else waited on isn't logged twice
+        future.exception()
+        raise
+
+    future.set_result(result)
+    loop.call_later(_LINGER_SECONDS, _evict, table, key, future)
+    return result
@@ -1,13 +1,21 @@
 """Balance check tool for querying wallet balances."""
 
-import os
 import httpx
-from spoon_ai.tools.base import BaseTool
+import orjson
 
+from ._base import LightTool
+from ._http import get_client
+from ._singleflight import singleflight
 
-class BalanceCheckTool(BaseTool):
+# Concurrent lookups for the same user share one request
+_INFLIGHT: dict = {}
+
+
+class BalanceCheckTool(LightTool):
     """Checks the GAS balance of a user's wallet."""
 
+    __slots__ = ()
+
     name: str = "check_balance"
     description: str = (
         "Checks the current GAS balance of the user's Neo X wallet. "
@@ -24,10 +32,6 @@ class BalanceCheckTool(BaseTool):
         "required": ["user_id"],
     }
 
-    def __init__(self):
-        super().__init__()
-        self.backend_url = os.getenv("LUNEF_BACKEND_URL", "http://localhost:8080")
-
     async def execute(self, user_id: str) -> str:
         """Check user's wallet balance.
 
@@ -37,28 +41,43 @@ class BalanceCheckTool(BaseTool):
         Returns:
             JSON string with balance info
         """
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.get(
-                    f"{self.backend_url}/api/v1/wallets/balance",
-                    headers={"X-User-Id": user_id},
-                    timeout=15.0,
-                )
+        return await singleflight(
+            ("balance", user_id),
+            lambda: self._fetch_balance(user_id),
+            _INFLIGHT,
+        )
+
+    async def _fetch_balance(self, user_id: str) -> str:
+        """Fetch the balance from the backend.
+
+        Args:
+            user_id: The user's UUID
+
+        Returns:
+            JSON string with balance info
+        """
+        client = get_client()
+        try:
+            response = await client.get(
+                "/api/v1/wallets/balance",
+                headers={"X-User-Id": user_id},
+                timeout=15.0,
+            )
 
-                if response.status_code == 200:
-                    data = response.json()
-                    return (
-                        f'{{"gas_balance": "{data.get("gas_balance", "0")}", '
-                        f'"fiat_equivalent": {data.get("fiat_equivalent", 0)}, '
-                        f'"fiat_currency": "{data.get("fiat_currency", "USD")}", '
-                        f'"address": "{data.get("address", "")}"}}'
-                    )
-                elif response.status_code == 404:
-                    return '{"error": "Wallet not found. Please create a wallet first."}'
-                else:
-                    return f'{{"error": "Failed to check balance: {response.status_code}"}}'
+            if response.status_code == 200:
+                data = orjson.loads(response.content)
+                return orjson.dumps({
+                    "gas_balance": str(data.get("gas_balance", "0")),
+                    "fiat_equivalent": data.get("fiat_equivalent", 0),
+                    "fiat_currency": str(data.get("fiat_currency", "USD")),
+                    "address": str(data.get("address", "")),
+                }).decode()
+            elif response.status_code == 404:
+                return '{"error": "Wallet not found. Please create a wallet first."}'
+            else:
+                return orjson.dumps({"error": f"Failed to check balance: {response.status_code}"}).decode()
 
-            except httpx.TimeoutException:
-                return '{"error": "Balance check timed out. The blockchain may be slow."}'
-            except httpx.RequestError as e:
-                return f'{{"error": "Network error: {str(e)}"}}'
+        except httpx.TimeoutException:
+            return '{"error": "Balance check timed out. The blockchain may be slow."}'
+        except httpx.RequestError as e:
+            return orjson.dumps({"error": f"Network error: {e}"}).decode()
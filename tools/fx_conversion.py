@@ -1,13 +1,61 @@
 """FX conversion tool for converting fiat to GAS."""
 
-import os
+import asyncio
+import time
+from typing import Optional
+
 import httpx
-from spoon_ai.tools.base import BaseTool
+import orjson
+
+from ._base import LightTool
+from ._http import get_client
+
+# Seconds a fetched rate is reused before going back to the backend
+_RATE_TTL = 60.0
+
+# currency -> (gas_per_fiat, fx_rate, gas_price_usd, fetched_at)
+_RATE_CACHE: dict[str, tuple[float, float, float, float]] = {}
+
+# One lock per currency so concurrent cold misses issue a single request
+_RATE_LOCKS: dict[str, asyncio.Lock] = {}
+
+
+def _cached_conversion(amount: float, currency: str) -> Optional[str]:
+    """Convert locally from a fresh cached rate, if there is one."""
+    cached = _RATE_CACHE.get(currency)
+    if cached is None or time.monotonic() - cached[3] >= _RATE_TTL:
+        return None
 
+    gas_per_fiat, fx_rate, gas_price_usd, _ = cached
+    return orjson.dumps({
+        "fiat_amount": amount,
+        "fiat_currency": currency,
+        "gas_amount": f"{amount * gas_per_fiat:.8f}",
+        "fx_rate": fx_rate,
+        "gas_price_usd": gas_price_usd,
+    }).decode()
 
-class FXConversionTool(BaseTool):
+
+def _cache_rate(currency: str, data: dict) -> None:
+    """Remember the effective rate from a backend conversion."""
+    try:
+        gas_per_fiat = float(data["gas_amount"]) / float(data["fiat_amount"])
+    except (KeyError, TypeError, ValueError, ZeroDivisionError):
+        return
+
+    _RATE_CACHE[currency] = (
+        gas_per_fiat,
+        data.get("fx_rate", 0),
+        data.get("gas_price_usd", 0),
+        time.monotonic(),
+    )
+
+
+class FXConversionTool(LightTool):
     """Converts fiat currency amounts to Neo X GAS."""
 
+    __slots__ = ()
+
     name: str = "convert_fiat_to_gas"
     description: str = (
         "Converts a fiat currency amount (GBP, EUR, USD, CHF) to Neo X GAS. "
@@ -29,10 +77,6 @@ class FXConversionTool(BaseTool):
         "required": ["amount", "currency"],
     }
 
-    def __init__(self):
-        super().__init__()
-        self.backend_url = os.getenv("LUNEF_BACKEND_URL", "http://localhost:8080")
-
     async def execute(self, amount: float, currency: str) -> str:
         """Convert fiat amount to GAS.
 
@@ -45,32 +89,55 @@ class FXConversionTool(BaseTool):
         """
         currency = currency.upper()
         if currency not in ["GBP", "EUR", "USD", "CHF"]:
-            return f'{{"error": "Unsupported currency: {currency}. Use GBP, EUR, USD, or CHF."}}'
+            return orjson.dumps({"error": f"Unsupported currency: {currency}. Use GBP, EUR, USD, or CHF."}).decode()
 
         if amount <= 0:
             return '{"error": "Amount must be positive"}'
 
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.get(
-                    f"{self.backend_url}/api/v1/rates/fiat-to-gas",
-                    params={"fiat": currency, "amount": amount},
-                    timeout=10.0,
-                )
-
-                if response.status_code == 200:
-                    data = response.json()
-                    return (
-                        f'{{"fiat_amount": {data.get("fiat_amount", amount)}, '
-                        f'"fiat_currency": "{data.get("fiat_currency", currency)}", '
-                        f'"gas_amount": "{data.get("gas_amount", "0")}", '
-                        f'"fx_rate": {data.get("fx_rate", 0)}, '
-                        f'"gas_price_usd": {data.get("gas_price_usd", 0)}}}'
-                    )
-                else:
-                    return f'{{"error": "Conversion failed: {response.status_code}"}}'
-
-            except httpx.TimeoutException:
-                return '{"error": "Conversion service timed out"}'
-            except httpx.RequestError as e:
-                return f'{{"error": "Network error: {str(e)}"}}'
+        cached = _cached_conversion(amount, currency)
+        if cached is not None:
+            return cached
+
+        async with _RATE_LOCKS.setdefault(currency, asyncio.Lock()):
+            # Another caller may have refreshed the rate while we waited
+            cached = _cached_conversion(amount, currency)
+            if cached is not None:
+                return cached
+
+            return await self._fetch_conversion(amount, currency)
+
+    async def _fetch_conversion(self, amount: float, currency: str) -> str:
+        """Convert via the backend and cache the resulting rate.
+
+        Args:
+            amount: The fiat amount
+            currency: The currency code (GBP, EUR, USD, CHF)
+
+        Returns:
+            JSON string with conversion result
+        """
+        client = get_client()
+        try:
+            response = await client.get(
+                "/api/v1/rates/fiat-to-gas",
+                params={"fiat": currency, "amount": amount},
+                timeout=10.0,
+            )
+
+            if response.status_code == 200:
+                data = orjson.loads(response.content)
+                _cache_rate(currency, data)
+                return orjson.dumps({
+                    "fiat_amount": data.get("fiat_amount", amount),
+                    "fiat_currency": str(data.get("fiat_currency", currency)),
+                    "gas_amount": str(data.get("gas_amount", "0")),
+                    "fx_rate": data.get("fx_rate", 0),
+                    "gas_price_usd": data.get("gas_price_usd", 0),
+                }).decode()
+            else:
+                return orjson.dumps({"error": f"Conversion failed: {response.status_code}"}).decode()
+
+        except httpx.TimeoutException:
+            return '{"error": "Conversion service timed out"}'
+        except httpx.RequestError as e:
+            return orjson.dumps({"error": f"Network error: {e}"}).decode()
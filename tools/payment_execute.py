@@ -1,14 +1,17 @@
 """Payment execute tool for executing confirmed payments."""
 
-import os
-import json
 import httpx
-from spoon_ai.tools.base import BaseTool
+import orjson
 
+from ._base import LightTool
+from ._http import get_client
 
-class PaymentExecuteTool(BaseTool):
+
+class PaymentExecuteTool(LightTool):
     """Executes a confirmed payment on Neo X."""
 
+    __slots__ = ()
+
     name: str = "execute_payment"
     description: str = (
         "Executes a payment after the user has confirmed it. "
@@ -30,10 +33,6 @@ class PaymentExecuteTool(BaseTool):
         "required": ["user_id", "preview_id"],
     }
 
-    def __init__(self):
-        super().__init__()
-        self.backend_url = os.getenv("LUNEF_BACKEND_URL", "http://localhost:8080")
-
     async def execute(self, user_id: str, preview_id: str) -> str:
         """Execute a confirmed payment.
 
@@ -44,42 +43,60 @@ class PaymentExecuteTool(BaseTool):
         Returns:
             JSON string with transaction result
         """
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.post(
-                    f"{self.backend_url}/api/v1/payments/{preview_id}/execute",
-                    headers={"X-User-Id": user_id},
-                    timeout=60.0,  # Longer timeout for blockchain transactions
-                )
+        return orjson.dumps(await self.execute_typed(user_id, preview_id)).decode()
+
+    async def execute_typed(self, user_id: str, preview_id: str) -> dict:
+        """Execute a confirmed payment and return the result as a dict.
+
+        Used by the agent's confirmation path, which would otherwise
+        serialize the result only to parse it straight back. The request is
+        streamed so cancelling the calling task aborts it promptly.
+
+        Args:
+            user_id: The sender's UUID
+            preview_id: The payment preview ID
+
+        Returns:
+            Dictionary with transaction result
+        """
+        client = get_client()
+        try:
+            async with client.stream(
+                "POST",
+                f"/api/v1/payments/{preview_id}/execute",
+                headers={"X-User-Id": user_id},
+                timeout=60.0,  # Longer timeout for blockchain transactions
+            ) as response:
+                body = await response.aread()
 
-                if response.status_code == 200:
-                    data = response.json()
-                    return json.dumps({
-                        "success": True,
-                        "tx_hash": data.get("tx_hash"),
-                        "explorer_url": data.get("explorer_url"),
-                        "amount_gas": data.get("amount_gas"),
-                        "to_tag": data.get("to_tag"),
-                        "status": data.get("status", "confirmed"),
-                        "confirmation_message": (
-                            f"Payment sent successfully! {data.get('amount_gas')} GAS "
-                            f"has been sent to {data.get('to_tag')}. "
-                            f"Transaction: {data.get('tx_hash')[:16]}..."
-                        ),
-                    })
-                elif response.status_code == 404:
-                    return '{"error": "Payment preview expired or not found. Please start a new payment."}'
-                elif response.status_code == 403:
-                    return '{"error": "Insufficient balance or payment not confirmed"}'
-                elif response.status_code == 409:
-                    return '{"error": "Payment already executed"}'
-                else:
-                    return f'{{"error": "Payment failed: {response.status_code}"}}'
+            if response.status_code == 200:
+                data = orjson.loads(body)
+                return {
+                    "success": True,
+                    "tx_hash": data.get("tx_hash"),
+                    "explorer_url": data.get("explorer_url"),
+                    "amount_gas": data.get("amount_gas"),
+                    "to_tag": data.get("to_tag"),
+                    "status": data.get("status", "confirmed"),
+                    "confirmation_message": (
+                        f"Payment sent successfully! {data.get('amount_gas')} GAS "
+                        f"has been sent to {data.get('to_tag')}. "
+                        f"Transaction: {data.get('tx_hash')[:16]}..."
+                    ),
+                }
+            elif response.status_code == 404:
+                return {"error": "Payment preview expired or not found. Please start a new payment."}
+            elif response.status_code == 403:
+                return {"error": "Insufficient balance or payment not confirmed"}
+            elif response.status_code == 409:
+                return {"error": "Payment already executed"}
+            else:
+                return {"error": f"Payment failed: {response.status_code}"}
 
-            except httpx.TimeoutException:
-                return json.dumps({
-                    "warning": "Transaction may still be processing",
-                    "message": "The payment was submitted but confirmation timed out. Please check your transaction history.",
-                })
-            except httpx.RequestError as e:
-                return f'{{"error": "Network error: {str(e)}"}}'
+        except httpx.TimeoutException:
+            return {
+                "warning": "Transaction may still be processing",
+                "message": "The payment was submitted but confirmation timed out. Please check your transaction history.",
+            }
+        except httpx.RequestError as e:
+            return {"error": f"Network error: {e}"}
@@ -0,0 +1,140 @@
+"""Payment prepare tool for building a payment preview in one backend call."""
+
+import httpx
+import orjson
+
+from ._base import LightTool
+from ._http import get_client
+
+_ERR_UNAVAILABLE = orjson.dumps({
+    "error": (
+        "prepare_payment is not available on this backend. "
+        "Use resolve_tag, convert_fiat_to_gas, check_balance and create_payment_preview instead."
+    ),
+}).decode()
+
+
+def _is_tag_not_found(body: bytes) -> bool:
+    """Whether a 404 body says the recipient tag doesn't exist."""
+    try:
+        data = orjson.loads(body)
+    except orjson.JSONDecodeError:
+        return False
+    if not isinstance(data, dict):
+        return False
+
+    if str(data.get("code", "")).lower() == "tag_not_found":
+        return True
+    message = str(data.get("message") or data.get("error") or "").lower()
+    return "tag" in message and "not found" in message
+
+
+class PaymentPrepareTool(LightTool):
+    """Resolves, converts, checks balance and creates a preview in one step."""
+
+    __slots__ = ()
+
+    name: str = "prepare_payment"
+    description: str = (
+        "Prepares a payment to a Lunef @tag in a single step: resolves the recipient's address, "
+        "converts the fiat amount to GAS, checks the user's balance and creates a payment preview. "
+        "Use this whenever the user wants to send money. The preview requires voice confirmation "
+        "before execution."
+    )
+    parameters: dict = {
+        "type": "object",
+        "properties": {
+            "user_id": {
+                "type": "string",
+                "description": "The sender's user UUID",
+            },
+            "tag": {
+                "type": "string",
+                "description": "The recipient's Lunef tag (e.g., '@alice' or 'alice')",
+            },
+            "amount": {
+                "type": "number",
+                "description": "The amount in fiat currency",
+            },
+            "currency": {
+                "type": "string",
+                "enum": ["GBP", "EUR", "USD", "CHF"],
+                "description": "The fiat currency code (GBP, EUR, USD, or CHF)",
+            },
+        },
+        "required": ["user_id", "tag", "amount", "currency"],
+    }
+
+    async def execute(self, user_id: str, tag: str, amount: float, currency: str) -> str:
+        """Prepare a payment preview.
+
+        Args:
+            user_id: The sender's UUID
+            tag: Recipient's @tag (with or without @ prefix)
+            amount: The fiat amount
+            currency: The currency code (GBP, EUR, USD, CHF)
+
+        Returns:
+            JSON string with preview details or error
+        """
+        clean_tag = tag.lstrip("@").lower().strip()
+        currency = currency.upper()
+
+        if not clean_tag:
+            return '{"error": "Empty tag provided"}'
+
+        if currency not in ["GBP", "EUR", "USD", "CHF"]:
+            return orjson.dumps({"error": f"Unsupported currency: {currency}. Use GBP, EUR, USD, or CHF."}).decode()
+
+        if amount <= 0:
+            return '{"error": "Amount must be positive"}'
+
+        client = get_client()
+        try:
+            response = await client.post(
+                "/api/v1/payments/prepare",
+                headers={"X-User-Id": user_id},
+                json={
+                    "tag": clean_tag,
+                    "amount": amount,
+                    "currency": currency,
+                },
+                timeout=15.0,
+            )
+
+            if response.status_code == 200:
+                data = orjson.loads(response.content)
+                return orjson.dumps({
+                    "preview_id": data.get("preview_id"),
+                    "from_address": data.get("from_address"),
+                    "to_address": data.get("address"),
+                    "to_tag": f"@{clean_tag}",
+                    "amount_gas": data.get("gas_amount"),
+                    "fiat_amount": amount,
+                    "fiat_currency": currency,
+                    "estimated_fee": data.get("estimated_fee", "0.001"),
+                    "total_gas": data.get("total_gas"),
+                    "status": "awaiting_confirmation",
+                    "confirmation_message": (
+                        f"You're about to send {amount} {currency} "
+                        f"(approximately {data.get('gas_amount')} GAS) to @{clean_tag}. "
+                        f"Please confirm by saying 'yes' or 'confirm'."
+                    ),
+                }).decode()
+            elif response.status_code == 400:
+                error_data = orjson.loads(response.content)
+                return orjson.dumps({"error": error_data.get("message", "Invalid payment request")}).decode()
+            elif response.status_code == 403:
+                return '{"error": "Insufficient balance for this payment"}'
+            elif response.status_code == 404:
+                # A 404 from a backend without the prepare route is not a missing tag
+                if _is_tag_not_found(response.content):
+                    return orjson.dumps({"error": f"Tag @{clean_tag} not found. Please check the spelling."}).decode()
+                return _ERR_UNAVAILABLE
+            else:
+                return orjson.dumps({"error": f"Failed to prepare payment: {response.status_code}"}).decode()
+
+        except httpx.TimeoutException:
+            return '{"error": "Payment preparation timed out"}'
+        except httpx.RequestError as e:
+            return orjson.dumps({"error": f"Network error: {e}"}).decode()
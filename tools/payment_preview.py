@@ -1,14 +1,17 @@
 """Payment preview tool for creating payment previews."""
 
-import os
-import json
 import httpx
-from spoon_ai.tools.base import BaseTool
+import orjson
 
+from ._base import LightTool
+from ._http import get_client
 
-class PaymentPreviewTool(BaseTool):
+
+class PaymentPreviewTool(LightTool):
     """Creates a payment preview for user confirmation."""
 
+    __slots__ = ()
+
     name: str = "create_payment_preview"
     description: str = (
         "Creates a payment preview that shows the user exactly what will be sent. "
@@ -46,10 +49,6 @@ class PaymentPreviewTool(BaseTool):
         "required": ["user_id", "to_address", "to_tag", "amount_gas", "fiat_amount", "fiat_currency"],
     }
 
-    def __init__(self):
-        super().__init__()
-        self.backend_url = os.getenv("LUNEF_BACKEND_URL", "http://localhost:8080")
-
     async def execute(
         self,
         user_id: str,
@@ -72,49 +71,49 @@ class PaymentPreviewTool(BaseTool):
         Returns:
             JSON string with preview details or error
         """
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.post(
-                    f"{self.backend_url}/api/v1/payments/preview",
-                    headers={"X-User-Id": user_id},
-                    json={
-                        "to_address": to_address,
-                        "to_tag": to_tag,
-                        "amount_gas": amount_gas,
-                        "fiat_amount": fiat_amount,
-                        "fiat_currency": fiat_currency.upper(),
-                    },
-                    timeout=15.0,
-                )
+        client = get_client()
+        try:
+            response = await client.post(
+                "/api/v1/payments/preview",
+                headers={"X-User-Id": user_id},
+                json={
+                    "to_address": to_address,
+                    "to_tag": to_tag,
+                    "amount_gas": amount_gas,
+                    "fiat_amount": fiat_amount,
+                    "fiat_currency": fiat_currency.upper(),
+                },
+                timeout=15.0,
+            )
 
-                if response.status_code == 200:
-                    data = response.json()
-                    return json.dumps({
-                        "preview_id": data.get("preview_id"),
-                        "from_address": data.get("from_address"),
-                        "to_address": data.get("to_address"),
-                        "to_tag": to_tag,
-                        "amount_gas": data.get("amount_gas"),
-                        "fiat_amount": fiat_amount,
-                        "fiat_currency": fiat_currency.upper(),
-                        "estimated_fee": data.get("estimated_fee", "0.001"),
-                        "total_gas": data.get("total_gas"),
-                        "status": "awaiting_confirmation",
-                        "confirmation_message": (
-                            f"You're about to send {fiat_amount} {fiat_currency.upper()} "
-                            f"(approximately {data.get('amount_gas')} GAS) to {to_tag}. "
-                            f"Please confirm by saying 'yes' or 'confirm'."
-                        ),
-                    })
-                elif response.status_code == 400:
-                    error_data = response.json()
-                    return json.dumps({"error": error_data.get("message", "Invalid payment request")})
-                elif response.status_code == 403:
-                    return '{"error": "Insufficient balance for this payment"}'
-                else:
-                    return f'{{"error": "Failed to create preview: {response.status_code}"}}'
+            if response.status_code == 200:
+                data = orjson.loads(response.content)
+                return orjson.dumps({
+                    "preview_id": data.get("preview_id"),
+                    "from_address": data.get("from_address"),
+                    "to_address": data.get("to_address"),
+                    "to_tag": to_tag,
+                    "amount_gas": data.get("amount_gas"),
+                    "fiat_amount": fiat_amount,
+                    "fiat_currency": fiat_currency.upper(),
+                    "estimated_fee": data.get("estimated_fee", "0.001"),
+                    "total_gas": data.get("total_gas"),
+                    "status": "awaiting_confirmation",
+                    "confirmation_message": (
+                        f"You're about to send {fiat_amount} {fiat_currency.upper()} "
+                        f"(approximately {data.get('amount_gas')} GAS) to {to_tag}. "
+                        f"Please confirm by saying 'yes' or 'confirm'."
+                    ),
+                }).decode()
+            elif response.status_code == 400:
+                error_data = orjson.loads(response.content)
+                return orjson.dumps({"error": error_data.get("message", "Invalid payment request")}).decode()
+            elif response.status_code == 403:
+                return '{"error": "Insufficient balance for this payment"}'
+            else:
+                return orjson.dumps({"error": f"Failed to create preview: {response.status_code}"}).decode()
 
-            except httpx.TimeoutException:
-                return '{"error": "Payment preview timed out"}'
-            except httpx.RequestError as e:
-                return f'{{"error": "Network error: {str(e)}"}}'
+        except httpx.TimeoutException:
+            return '{"error": "Payment preview timed out"}'
+        except httpx.RequestError as e:
+            return orjson.dumps({"error": f"Network error: {e}"}).decode()
@@ -1,13 +1,21 @@
 """Tag resolver tool for resolving @tags to Neo X addresses."""
 
-import os
 import httpx
-from spoon_ai.tools.base import BaseTool
+import orjson
 
+from ._base import LightTool
+from ._http import get_client
+from ._singleflight import singleflight
 
-class TagResolverTool(BaseTool):
+# Concurrent lookups for the same tag share one request
+_INFLIGHT: dict = {}
+
+
+class TagResolverTool(LightTool):
     """Resolves a @luneftag to a Neo X wallet address."""
 
+    __slots__ = ()
+
     name: str = "resolve_tag"
     description: str = (
         "Resolves a Lunef tag (like @alice or @bob) to the recipient's Neo X wallet address. "
@@ -24,10 +32,6 @@ class TagResolverTool(BaseTool):
         "required": ["tag"],
     }
 
-    def __init__(self):
-        super().__init__()
-        self.backend_url = os.getenv("LUNEF_BACKEND_URL", "http://localhost:8080")
-
     async def execute(self, tag: str) -> str:
         """Resolve a tag to a Neo X address.
 
@@ -43,22 +47,41 @@ class TagResolverTool(BaseTool):
         if not clean_tag:
             return '{"error": "Empty tag provided"}'
 
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.get(
-                    f"{self.backend_url}/api/v1/users/tag/{clean_tag}",
-                    timeout=10.0,
-                )
-
-                if response.status_code == 200:
-                    data = response.json()
-                    return f'{{"tag": "@{clean_tag}", "address": "{data.get("wallet_address", "")}", "display_name": "{data.get("display_name", clean_tag)}"}}'
-                elif response.status_code == 404:
-                    return f'{{"error": "Tag @{clean_tag} not found. Please check the spelling."}}'
-                else:
-                    return f'{{"error": "Failed to resolve tag: {response.status_code}"}}'
-
-            except httpx.TimeoutException:
-                return '{"error": "Request timed out. Please try again."}'
-            except httpx.RequestError as e:
-                return f'{{"error": "Network error: {str(e)}"}}'
+        return await singleflight(
+            ("tag", clean_tag),
+            lambda: self._resolve(clean_tag),
+            _INFLIGHT,
+        )
+
+    async def _resolve(self, clean_tag: str) -> str:
+        """Look up a normalized tag on the backend.
+
+        Args:
+            clean_tag: Lowercase tag without the @ prefix
+
+        Returns:
+            JSON string with address or error
+        """
+        client = get_client()
+        try:
+            response = await client.get(
+                f"/api/v1/users/tag/{clean_tag}",
+                timeout=10.0,
+            )
+
+            if response.status_code == 200:
+                data = orjson.loads(response.content)
+                return orjson.dumps({
+                    "tag": f"@{clean_tag}",
+                    "address": str(data.get("wallet_address", "")),
+                    "display_name": str(data.get("display_name", clean_tag)),
+                }).decode()
+            elif response.status_code == 404:
+                return orjson.dumps({"error": f"Tag @{clean_tag} not found. Please check the spelling."}).decode()
+            else:
+                return orjson.dumps({"error": f"Failed to resolve tag: {response.status_code}"}).decode()
+
+        except httpx.TimeoutException:
+            return '{"error": "Request timed out. Please try again."}'
+        except httpx.RequestError as e:
+            return orjson.dumps({"error": f"Network error: {e}"}).decode()
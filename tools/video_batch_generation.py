@@ -0,0 +1,83 @@
+"""Batch video generation tool for several prompts in one request."""
+
+from typing import Optional
+
+import orjson
+
+from ._base import LightTool
+from .video_generation import DUR_MAX, DUR_MIN, STYLE_IDS, VideoGenerationTool
+
+
+class VideoBatchGenerationTool(LightTool):
+    """Generates several AI videos in a single x402-paid backend request."""
+
+    __slots__ = ("video_tool",)
+
+    name: str = "generate_videos_batch"
+    description: str = (
+        "Generates several AI videos at once from a list of text prompts. "
+        "Use this instead of calling generate_video repeatedly when the user asks for more than one video. "
+        "The user will be charged in GAS, and the backend handles the x402 payment automatically."
+    )
+    parameters: dict = {
+        "type": "object",
+        "properties": {
+            "user_id": {
+                "type": "string",
+                "description": "The user's UUID for billing",
+            },
+            "prompts": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": "Text prompts, one per video",
+            },
+            "durations": {
+                "type": "array",
+                "items": {"type": "integer", "minimum": DUR_MIN, "maximum": DUR_MAX},
+                "description": f"Video durations in seconds ({DUR_MIN}-{DUR_MAX}), one per prompt",
+            },
+            "styles": {
+                "type": "array",
+                "items": {
+                    "type": "string",
+                    "enum": list(STYLE_IDS),
+                },
+                "description": "Visual styles, one per prompt",
+            },
+        },
+        "required": ["user_id", "prompts"],
+    }
+
+    def __init__(self):
+        super().__init__()
+        self.video_tool = VideoGenerationTool()
+
+    async def execute(
+        self,
+        user_id: str,
+        prompts: list[str],
+        durations: Optional[list[int]] = None,
+        styles: Optional[list[str]] = None,
+    ) -> str:
+        """Generate several AI videos.
+
+        Args:
+            user_id: User's UUID
+            prompts: Video descriptions
+            durations: Video lengths in seconds, defaults to 10 each
+            styles: Visual styles, defaults to cinematic each
+
+        Returns:
+            JSON string with the generated videos or error
+        """
+        durations = durations or [10] * len(prompts)
+        styles = styles or ["cinematic"] * len(prompts)
+
+        if not len(prompts) == len(durations) == len(styles):
+            return orjson.dumps({"error": "prompts, durations and styles must have the same length"}).decode()
+
+        jobs = [
+            {"prompt": prompt, "duration_seconds": duration, "style": style}
+            for prompt, duration, style in zip(prompts, durations, styles)
+        ]
+        return await self.video_tool.execute_batch(user_id, jobs)
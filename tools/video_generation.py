@@ -1,59 +1,524 @@
 """Video generation tool with x402 payment integration."""
 
+import asyncio
+import atexit
+import hashlib
 import os
-import json
+import tempfile
+import time
+from contextlib import suppress
+from datetime import datetime, timezone
+from typing import Callable, Optional
+
 import httpx
-from spoon_ai.tools.base import BaseTool
+import orjson
+from cachetools import TTLCache
+
+from ._base import LightTool
+from ._breaker import CircuitBreaker, parse_retry_after
+from ._http import BACKEND_URL, get_client
+from ._singleflight import singleflight
+
+# x402 facilitator for machine-to-machine payments
+_X402_FACILITATOR = os.getenv("X402_FACILITATOR_URL", "https://x402.org/facilitator")
+
+# Video generation API (could be Runway, Pika, etc.)
+_VIDEO_API = os.getenv("VIDEO_API_URL", "https://api.example.com/video")
+
+# Backend endpoints, relative to the shared client's base_url
+_GENERATE_PATH = "/api/v1/content/video/generate"
+_GENERATE_BATCH_PATH = "/api/v1/content/video/generate_batch"
+_X402_SETTLE_PATH = "/api/v1/x402/settle"
+
+# Cost per second of video in USDC (for x402 payment)
+_COST_PER_SEC = float(os.getenv("VIDEO_COST_PER_SECOND", "0.10"))
+
+# Accepted video length in seconds, mirroring the parameters schema
+DUR_MIN, DUR_MAX = 5, 30
+
+# Supported styles and their wire ids; the backend dispatches on style_id
+STYLE_IDS = {"cinematic": 0, "anime": 1, "realistic": 2, "artistic": 3, "cartoon": 4}
+
+# Last known USDC balance per user, for a pre-flight affordability check
+_BAL_CACHE: TTLCache = TTLCache(maxsize=10_000, ttl=15)
+
+# Generated videos per (user, prompt, duration, style), so repeats don't re-pay x402
+_VIDEO_CACHE: TTLCache = TTLCache(maxsize=1024, ttl=3600)
+
+# Settled x402 authorization per user: (payment_id, receipt_id, expires_at).
+# Attached up front so calls within the window skip the 402 round-trip.
+_X402_AUTH_CACHE: TTLCache = TTLCache(maxsize=10_000, ttl=300)
+
+# Most a 402 challenge may ask for, relative to our own cost estimate, before
+# we refuse to settle it automatically
+_X402_MAX_OVERAGE = 1.01
+
+# USDC amounts in x402 requirements are in atomic units
+_USDC_DECIMALS = 6
+
+# Raw video bodies spooled to disk, removed after this long (or at exit)
+_SPOOL_TTL = float(os.getenv("VIDEO_SPOOL_TTL", "3600"))
+_SPOOLED: set[str] = set()
+
+# Stops hammering the backend (and the paid x402 upstream) while it is overloaded
+_BREAKER = CircuitBreaker(threshold=5, ttl=30.0)
+
+# Per-user Retry-After from a 429: monotonic time before which we don't retry
+_RATE_HOLD: TTLCache = TTLCache(maxsize=10_000, ttl=3600)
+
+# Concurrent identical requests share one backend job (and one x402 payment)
+_INFLIGHT: dict = {}
+
+# Fixed responses, serialized once at import
+_ERR_INSUFFICIENT = orjson.dumps({"error": "Insufficient GAS balance for video generation"}).decode()
+_ERR_RATE_LIMITED = orjson.dumps({"error": "Rate limited. Please try again in a few minutes."}).decode()
+_ERR_NO_JOBS = orjson.dumps({"error": "No videos requested"}).decode()
+_ERR_UNREACHABLE = orjson.dumps({"error": "Network error: could not reach the video backend"}).decode()
+_ERR_BATCH_RAW_VIDEO = orjson.dumps({
+    "error": "Video batch failed: the backend returned a single video file instead of a video list",
+}).decode()
+_STILL_PROCESSING = orjson.dumps({
+    "status": "processing",
+    "message": (
+        "Video generation is taking longer than expected. "
+        "It will be ready soon - check your content library."
+    ),
+}).decode()
+_BATCH_STILL_PROCESSING = orjson.dumps({
+    "status": "processing",
+    "message": (
+        "Video generation is taking longer than expected. "
+        "They will be ready soon - check your content library."
+    ),
+}).decode()
+
+# Fail fast if the backend is unreachable, but give generation itself room
+_VIDEO_TIMEOUT = httpx.Timeout(
+    connect=float(os.getenv("VIDEO_HTTP_CONNECT_TIMEOUT", "3.0")),
+    read=float(os.getenv("VIDEO_HTTP_READ_TIMEOUT", "180.0")),
+    write=float(os.getenv("VIDEO_HTTP_WRITE_TIMEOUT", "600.0")),
+    pool=float(os.getenv("VIDEO_HTTP_POOL_TIMEOUT", "5.0")),
+)
+
+# Tool schema, built once at import and shared by every instance
+_VIDEO_PARAMS: dict = {
+    "type": "object",
+    "properties": {
+        "user_id": {
+            "type": "string",
+            "description": "The user's UUID for billing",
+        },
+        "prompt": {
+            "type": "string",
+            "description": "The text prompt describing the video to generate",
+        },
+        "duration_seconds": {
+            "type": "integer",
+            "description": f"Video duration in seconds ({DUR_MIN}-{DUR_MAX})",
+            "minimum": DUR_MIN,
+            "maximum": DUR_MAX,
+        },
+        "style": {
+            "type": "string",
+            "enum": list(STYLE_IDS),
+            "description": "The visual style for the video",
+        },
+    },
+    "required": ["user_id", "prompt"],
+}
+
+
+def _remember_balance(user_id: str, data: dict) -> None:
+    """Cache the remaining USDC balance reported by the backend, if any."""
+    remaining = data.get("remaining_balance_usdc")
+    if remaining is None:
+        return
+
+    try:
+        _BAL_CACHE[user_id] = float(remaining)
+    except (TypeError, ValueError):
+        _BAL_CACHE.pop(user_id, None)
+
+
+def _video_key(user_id: str, prompt: str, duration_seconds: int, style: str) -> str:
+    """Content hash identifying an identical video request."""
+    return hashlib.blake2b(
+        f"{user_id}|{prompt}|{duration_seconds}|{style}".encode(),
+        digest_size=16,
+    ).hexdigest()
+
+
+def _record_outcome(response: httpx.Response, user_id: str) -> None:
+    """Feed a backend response into the circuit breaker.
+
+    A 429 counts towards the breaker like a 5xx, but its Retry-After only
+    holds back the user who was rate limited.
+    """
+    if response.status_code == 429:
+        _BREAKER.record_failure()
+        retry_after = parse_retry_after(response.headers.get("retry-after"))
+        if retry_after:
+            _RATE_HOLD[user_id] = time.monotonic() + retry_after
+    elif response.status_code >= 500:
+        _BREAKER.record_failure()
+    else:
+        _BREAKER.record_success()
+
+
+def _unsupported_style(style: str) -> str:
+    """Error response for a style outside STYLE_IDS."""
+    return orjson.dumps({"error": f"Unsupported style: {style}. Use {', '.join(STYLE_IDS)}."}).decode()
+
+
+def _backend_busy(wait: float) -> str:
+    """Error response for calls rejected while the breaker is open."""
+    return orjson.dumps({
+        "error": "Video backend is busy",
+        "retry_after_seconds": round(wait),
+        "message": f"Video generation is temporarily unavailable. Please try again in {round(wait)} seconds.",
+    }).decode()
+
+
+def _rate_limited(wait: float) -> str:
+    """Error response for a user still inside their Retry-After window."""
+    return orjson.dumps({
+        "error": "Rate limited",
+        "retry_after_seconds": round(wait),
+        "message": f"Rate limited. Please try again in {round(wait)} seconds.",
+    }).decode()
+
+
+def _payment_required(response: httpx.Response, user_id: str, cost_usdc: float) -> str:
+    # x402 Payment Required that survived settlement
+    _BAL_CACHE.pop(user_id, None)
+    return orjson.dumps({
+        "error": "Payment required",
+        "cost_usdc": cost_usdc,
+        "message": "Video generation requires payment. Please ensure you have sufficient balance.",
+    }).decode()
+
+
+def _insufficient_balance(response: httpx.Response, user_id: str, cost_usdc: float) -> str:
+    _BAL_CACHE.pop(user_id, None)
+    return _ERR_INSUFFICIENT
+
+
+def _generation_failed(response: httpx.Response, user_id: str, cost_usdc: float) -> str:
+    return orjson.dumps({"error": f"Video generation failed: {response.status_code}"}).decode()
+
+
+# Non-200 backend statuses -> error response; anything else is _generation_failed
+_ERROR_HANDLERS: dict[int, Callable[[httpx.Response, str, float], str]] = {
+    402: _payment_required,
+    403: _insufficient_balance,
+    429: lambda response, user_id, cost_usdc: _ERR_RATE_LIMITED,
+}
+
+
+def _payment_headers(user_id: str) -> dict:
+    """Request headers, including the cached x402 proof if still valid."""
+    headers = {"X-User-Id": user_id, "Content-Type": "application/json"}
+    auth = _X402_AUTH_CACHE.get(user_id)
+    if auth is not None:
+        payment_id, receipt_id, expires_at = auth
+        if expires_at is None or expires_at > time.time():
+            headers["X-Payment-Id"] = payment_id
+            headers["X-Payment-Proof"] = receipt_id
+        else:
+            _X402_AUTH_CACHE.pop(user_id, None)
+    return headers
+
+
+def _affordable_requirement(body: bytes, cost_usdc: float) -> Optional[dict]:
+    """Pick a payment option from a 402 challenge that we are willing to pay.
+
+    Args:
+        body: Body of the 402 response (x402 PaymentRequiredResponse)
+        cost_usdc: Our own estimate of what the request should cost
+
+    Returns:
+        The first requirement asking for no more than the estimate (plus a
+        small margin), or None if the body is unusable or every option is
+        over budget or has no amount
+    """
+    try:
+        challenge = orjson.loads(body)
+    except orjson.JSONDecodeError:
+        return None
+    if not isinstance(challenge, dict):
+        return None
+
+    for requirement in challenge.get("accepts") or ():
+        if not isinstance(requirement, dict):
+            continue
+        extra = requirement.get("extra") or {}
+        try:
+            amount = int(requirement["maxAmountRequired"])
+            decimals = int(extra.get("decimals", _USDC_DECIMALS))
+        except (KeyError, TypeError, ValueError):
+            continue
+        if 0 < amount <= cost_usdc * _X402_MAX_OVERAGE * 10**decimals:
+            return requirement
+
+    return None
+
+
+def _parse_expiry(value) -> Optional[float]:
+    """Normalize a settle response's expires_at to a Unix timestamp.
+
+    Accepts epoch seconds (number or numeric string) or an ISO 8601 string;
+    naive datetimes are taken as UTC. None means no expiry of its own.
+
+    Raises:
+        ValueError: If the value can't be interpreted
+    """
+    if value is None:
+        return None
+    if isinstance(value, bool):
+        raise ValueError(f"Invalid expires_at: {value!r}")
+    if isinstance(value, (int, float)):
+        return float(value)
+    if not isinstance(value, str):
+        raise ValueError(f"Invalid expires_at: {value!r}")
+
+    try:
+        return float(value)
+    except ValueError:
+        pass
+
+    expires = datetime.fromisoformat(value.strip().replace("Z", "+00:00"))
+    if expires.tzinfo is None:
+        expires = expires.replace(tzinfo=timezone.utc)
+    return expires.timestamp()
+
+
+async def _settle_x402(
+    client: httpx.AsyncClient,
+    user_id: str,
+    requirements: bytes,
+    cost_usdc: float,
+) -> Optional[dict]:
+    """Settle a 402 challenge through the backend and cache the receipt.
+
+    Only challenges within our cost estimate are settled; anything missing
+    an amount or asking for more is left for the user to see. Receipts
+    whose expiry can't be read are used for the retry but not cached.
+
+    Args:
+        client: The shared backend client
+        user_id: User's UUID
+        requirements: Body of the 402 response (x402 PaymentRequiredResponse)
+        cost_usdc: Estimated cost of the request in USDC
+
+    Returns:
+        Payment proof headers for the retry, or None if nothing was settled
+    """
+    _X402_AUTH_CACHE.pop(user_id, None)
+    requirement = _affordable_requirement(requirements, cost_usdc)
+    if requirement is None:
+        return None
+
+    try:
+        response = await client.post(
+            _X402_SETTLE_PATH,
+            headers={"X-User-Id": user_id, "Content-Type": "application/json"},
+            content=orjson.dumps({"accepts": [requirement]}),
+        )
+    except httpx.RequestError:
+        return None
 
+    if response.status_code != 200:
+        return None
 
-class VideoGenerationTool(BaseTool):
+    try:
+        data = orjson.loads(response.content)
+    except orjson.JSONDecodeError:
+        return None
+
+    payment_id = data.get("payment_id")
+    receipt_id = data.get("receipt_id")
+    if not payment_id or not receipt_id:
+        return None
+
+    try:
+        expires_at = _parse_expiry(data.get("expires_at"))
+    except ValueError:
+        pass
+    else:
+        _X402_AUTH_CACHE[user_id] = (payment_id, receipt_id, expires_at)
+
+    return {"X-Payment-Id": payment_id, "X-Payment-Proof": receipt_id}
+
+
+def _discard_spooled(path: str) -> None:
+    """Delete a spooled video file, ignoring ones already gone."""
+    _SPOOLED.discard(path)
+    with suppress(FileNotFoundError):
+        os.unlink(path)
+
+
+@atexit.register
+def _discard_all_spooled() -> None:
+    for path in list(_SPOOLED):
+        _discard_spooled(path)
+
+
+async def _spool_video(response: httpx.Response) -> str:
+    """Stream a raw video body to a temp file instead of holding it in memory.
+
+    Disk writes run in a worker thread so they don't block the event loop.
+    A partial file is removed if the download fails; a complete one is
+    removed after _SPOOL_TTL seconds or when the process exits.
+
+    Returns:
+        Local path of the saved video
+    """
+    subtype = response.headers["content-type"].split("/", 1)[1].split(";", 1)[0].strip()
+    suffix = "." + "".join(c for c in subtype if c.isalnum() or c in "-_")
+    out = await asyncio.to_thread(
+        tempfile.NamedTemporaryFile, prefix="lunef-video-", suffix=suffix, delete=False
+    )
+    try:
+        async for chunk in response.aiter_bytes(1 << 20):
+            await asyncio.to_thread(out.write, chunk)
+        await asyncio.to_thread(out.close)
+    except BaseException:
+        out.close()
+        _discard_spooled(out.name)
+        raise
+
+    _SPOOLED.add(out.name)
+    asyncio.get_running_loop().call_later(_SPOOL_TTL, _discard_spooled, out.name)
+    return out.name
+
+
+async def _send(
+    client: httpx.AsyncClient,
+    path: str,
+    user_id: str,
+    content: bytes,
+    cost_usdc: float,
+) -> tuple[httpx.Response, Optional[dict], bytes]:
+    """POST a video request, settling one x402 challenge if the backend raises it.
+
+    The response is streamed so a backend returning the video itself never
+    gets buffered; such bodies are spooled to disk and their local path is
+    returned as data["video_file"]. A challenge is only settled if it asks for no more than cost_usdc.
+
+    Returns:
+        (response, data for a raw video body or None, JSON body bytes)
+    """
+    headers = _payment_headers(user_id)
+    for attempt in range(2):
+        async with client.stream(
+            "POST",
+            path,
+            headers=headers,
+            content=content,
+            timeout=_VIDEO_TIMEOUT,
+        ) as response:
+            if response.status_code == 200 and response.headers.get("content-type", "").startswith("video/"):
+                return response, {"video_file": await _spool_video(response)}, b""
+            body = await response.aread()
+
+        if response.status_code != 402 or attempt:
+            return response, None, body
+
+        proof = await _settle_x402(client, user_id, body, cost_usdc)
+        if proof is None:
+            return response, None, body
+        headers = {**headers, **proof}
+
+
+def _clamp_duration(duration_seconds: int) -> int:
+    """Clamp a requested video length to the supported range."""
+    if duration_seconds < DUR_MIN:
+        return DUR_MIN
+    if duration_seconds > DUR_MAX:
+        return DUR_MAX
+    return duration_seconds
+
+
+async def _request_video(
+    path: str,
+    user_id: str,
+    content: bytes,
+    cost_usdc: float,
+    still_processing: str,
+) -> tuple[Optional[str], Optional[dict], bytes]:
+    """Run the pre-flight checks, then POST a video request to the backend.
+
+    Shared by the single and batch paths: skips the call when the cached
+    balance, the user's Retry-After hold or the circuit breaker already
+    rules it out, feeds the outcome
+    to the breaker and maps non-200 statuses and network failures to error
+    responses.
+
+    Args:
+        path: Backend endpoint
+        user_id: User's UUID
+        content: Encoded JSON request body
+        cost_usdc: Estimated cost of the request in USDC
+        still_processing: Response to give if the backend is still working
+
+    Returns:
+        (error response or None, spooled-video data or None, JSON body bytes)
+    """
+    # Skip the round-trip when we already know the user can't afford it
+    balance = _BAL_CACHE.get(user_id)
+    if balance is not None and balance < cost_usdc:
+        return _ERR_INSUFFICIENT, None, b""
+
+    held_until = _RATE_HOLD.get(user_id)
+    if held_until is not None:
+        wait = held_until - time.monotonic()
+        if wait > 0:
+            return _rate_limited(wait), None, b""
+        _RATE_HOLD.pop(user_id, None)
+
+    wait = _BREAKER.remaining()
+    if wait:
+        return _backend_busy(wait), None, b""
+
+    try:
+        response, data, body = await _send(get_client(), path, user_id, content, cost_usdc)
+    except (httpx.ConnectTimeout, httpx.PoolTimeout):
+        # The request never reached the backend, so nothing is processing
+        _BREAKER.record_failure()
+        return _ERR_UNREACHABLE, None, b""
+    except httpx.ReadTimeout:
+        return still_processing, None, b""
+    except httpx.RequestError as e:
+        _BREAKER.record_failure()
+        return orjson.dumps({"error": f"Network error: {e}"}).decode(), None, b""
+
+    _record_outcome(response, user_id)
+    if response.status_code != 200:
+        handler = _ERROR_HANDLERS.get(response.status_code, _generation_failed)
+        return handler(response, user_id, cost_usdc), None, b""
+
+    return None, data, body
+
+
+class VideoGenerationTool(LightTool):
     """Generates AI videos with x402 machine-to-machine payment."""
 
+    __slots__ = ("backend_url", "x402_facilitator", "video_api_url", "cost_per_second_usdc")
+
     name: str = "generate_video"
     description: str = (
         "Generates an AI video based on a text prompt. "
         "This uses x402 protocol for machine-to-machine payment (USDC on Base Sepolia). "
         "The user will be charged in GAS, and the backend handles the x402 payment automatically."
     )
-    parameters: dict = {
-        "type": "object",
-        "properties": {
-            "user_id": {
-                "type": "string",
-                "description": "The user's UUID for billing",
-            },
-            "prompt": {
-                "type": "string",
-                "description": "The text prompt describing the video to generate",
-            },
-            "duration_seconds": {
-                "type": "integer",
-                "description": "Video duration in seconds (5-30)",
-                "minimum": 5,
-                "maximum": 30,
-            },
-            "style": {
-                "type": "string",
-                "enum": ["cinematic", "anime", "realistic", "artistic", "cartoon"],
-                "description": "The visual style for the video",
-            },
-        },
-        "required": ["user_id", "prompt"],
-    }
+    parameters: dict = _VIDEO_PARAMS
 
     def __init__(self):
         super().__init__()
-        self.backend_url = os.getenv("LUNEF_BACKEND_URL", "http://localhost:8080")
-        # x402 facilitator for machine-to-machine payments
-        self.x402_facilitator = os.getenv(
-            "X402_FACILITATOR_URL", "https://x402.org/facilitator"
-        )
-        # Video generation API (could be Runway, Pika, etc.)
-        self.video_api_url = os.getenv(
-            "VIDEO_API_URL", "https://api.example.com/video"
-        )
-        # Cost per second of video in USDC (for x402 payment)
-        self.cost_per_second_usdc = float(os.getenv("VIDEO_COST_PER_SECOND", "0.10"))
+        self.backend_url = BACKEND_URL
+        self.x402_facilitator = _X402_FACILITATOR
+        self.video_api_url = _VIDEO_API
+        self.cost_per_second_usdc = _COST_PER_SEC
 
     async def execute(
         self,
@@ -80,97 +545,206 @@ class VideoGenerationTool(BaseTool):
         Returns:
             JSON string with video URL or error
         """
-        # Validate duration
-        duration_seconds = max(5, min(30, duration_seconds))
+        if style not in STYLE_IDS:
+            return _unsupported_style(style)
+
+        duration_seconds = _clamp_duration(duration_seconds)
 
         # Calculate total cost in USDC
         total_cost_usdc = self.cost_per_second_usdc * duration_seconds
 
-        async with httpx.AsyncClient() as client:
-            try:
-                # Step 1: Request video generation with x402 payment
-                # The backend handles the x402 payment negotiation
-                response = await client.post(
-                    f"{self.backend_url}/api/v1/content/video/generate",
-                    headers={"X-User-Id": user_id},
-                    json={
-                        "prompt": prompt,
-                        "duration_seconds": duration_seconds,
-                        "style": style,
-                        "estimated_cost_usdc": total_cost_usdc,
-                    },
-                    timeout=120.0,  # Video generation can take time
-                )
-
-                if response.status_code == 200:
-                    data = response.json()
-                    return json.dumps({
-                        "success": True,
-                        "video_url": data.get("video_url"),
-                        "thumbnail_url": data.get("thumbnail_url"),
-                        "duration_seconds": duration_seconds,
-                        "style": style,
-                        "cost_gas": data.get("cost_gas"),
-                        "cost_usdc": total_cost_usdc,
-                        "purchase_id": data.get("purchase_id"),
-                        "status": "ready",
-                        "message": (
-                            f"Video generated successfully! "
-                            f"Duration: {duration_seconds}s, Style: {style}. "
-                            f"Cost: {data.get('cost_gas', '?')} GAS."
-                        ),
-                    })
-                elif response.status_code == 402:
-                    # x402 Payment Required - should not normally happen as backend handles it
-                    return json.dumps({
-                        "error": "Payment required",
-                        "cost_usdc": total_cost_usdc,
-                        "message": "Video generation requires payment. Please ensure you have sufficient balance.",
-                    })
-                elif response.status_code == 403:
-                    return '{"error": "Insufficient GAS balance for video generation"}'
-                elif response.status_code == 429:
-                    return '{"error": "Rate limited. Please try again in a few minutes."}'
-                else:
-                    return f'{{"error": "Video generation failed: {response.status_code}"}}'
-
-            except httpx.TimeoutException:
-                return json.dumps({
-                    "status": "processing",
-                    "message": (
-                        "Video generation is taking longer than expected. "
-                        "It will be ready soon - check your content library."
-                    ),
-                })
-            except httpx.RequestError as e:
-                return f'{{"error": "Network error: {str(e)}"}}'
-
-    async def _initiate_x402_payment(
+        key = _video_key(user_id, prompt, duration_seconds, style)
+        cached = _VIDEO_CACHE.get(key)
+        if cached is not None:
+            video_url, thumbnail_url, purchase_id = cached
+            return orjson.dumps({
+                "success": True,
+                "video_url": video_url,
+                "thumbnail_url": thumbnail_url,
+                "duration_seconds": duration_seconds,
+                "style": style,
+                "cost_gas": "0",
+                "cost_usdc": 0.0,
+                "purchase_id": purchase_id,
+                "status": "ready",
+                "cached": True,
+                "message": (
+                    f"This video was already generated. "
+                    f"Duration: {duration_seconds}s, Style: {style}. No additional charge."
+                ),
+            }).decode()
+
+        return await singleflight(
+            ("video", key),
+            lambda: self._generate(user_id, prompt, duration_seconds, style, total_cost_usdc, key),
+            _INFLIGHT,
+        )
+
+    async def _generate(
         self,
-        client: httpx.AsyncClient,
-        amount_usdc: float,
-        recipient: str,
-    ) -> dict:
-        """Initiate x402 payment flow.
-
-        This is called by the backend, not directly by this tool.
-        Included here for documentation purposes.
-
-        The x402 flow:
-        1. Client sends request to API
-        2. API returns 402 with payment details in header
-        3. Client creates payment authorization
-        4. Client retries request with payment proof
-        5. API verifies payment and processes request
+        user_id: str,
+        prompt: str,
+        duration_seconds: int,
+        style: str,
+        total_cost_usdc: float,
+        key: str,
+    ) -> str:
+        """Request a video from the backend.
 
         Args:
-            client: HTTP client
-            amount_usdc: Amount in USDC
-            recipient: Recipient address
+            user_id: User's UUID
+            prompt: Video description
+            duration_seconds: Clamped video length
+            style: Visual style
+            total_cost_usdc: Estimated cost in USDC
+            key: Content hash of the request, for the video cache
 
         Returns:
-            Payment result dictionary
+            JSON string with video URL or error
         """
-        # This would be implemented in the backend
-        # The x402 protocol handles EIP-3009 authorization
-        pass
+        # Step 1: Request video generation with x402 payment
+        error, data, body = await _request_video(
+            _GENERATE_PATH,
+            user_id,
+            orjson.dumps({
+                "prompt": prompt,
+                "duration_seconds": duration_seconds,
+                "style": style,
+                "style_id": STYLE_IDS[style],
+                "estimated_cost_usdc": total_cost_usdc,
+            }),
+            total_cost_usdc,
+            _STILL_PROCESSING,
+        )
+        if error is not None:
+            return error
+
+        if data is None:
+            data = orjson.loads(body)
+        _remember_balance(user_id, data)
+        video_url = data.get("video_url")
+        # Only finished videos with a link clients can open are worth replaying
+        if isinstance(video_url, str) and video_url.startswith(("https://", "http://")):
+            _VIDEO_CACHE[key] = (video_url, data.get("thumbnail_url"), data.get("purchase_id"))
+        result = {
+            "success": True,
+            "video_url": video_url,
+            "thumbnail_url": data.get("thumbnail_url"),
+            "duration_seconds": duration_seconds,
+            "style": style,
+            "cost_gas": data.get("cost_gas"),
+            "cost_usdc": total_cost_usdc,
+            "purchase_id": data.get("purchase_id"),
+            "status": "ready",
+            "cached": False,
+            "message": (
+                f"Video generated successfully! "
+                f"Duration: {duration_seconds}s, Style: {style}. "
+                f"Cost: {data.get('cost_gas', '?')} GAS."
+            ),
+        }
+        if "video_file" in data:
+            # Server-local, for the host app to deliver; not a URL clients can open
+            result["video_file"] = data["video_file"]
+            result["video_file_expires_in_seconds"] = _SPOOL_TTL
+        return orjson.dumps(result).decode()
+
+    async def execute_batch(self, user_id: str, jobs: list[dict]) -> str:
+        """Generate several videos in a single backend request.
+
+        The backend can pack the jobs into one generation pass, so the fixed
+        per-request overhead (auth, routing, x402 negotiation) is paid once.
+
+        Args:
+            user_id: User's UUID
+            jobs: Dicts with "prompt" and optional "duration_seconds" and "style"
+
+        Returns:
+            JSON string with the generated videos or error
+        """
+        if not jobs:
+            return _ERR_NO_JOBS
+
+        payload = []
+        total_cost_usdc = 0.0
+        for job in jobs:
+            style = job.get("style", "cinematic")
+            if style not in STYLE_IDS:
+                return _unsupported_style(style)
+
+            duration_seconds = _clamp_duration(job.get("duration_seconds", 10))
+            cost_usdc = self.cost_per_second_usdc * duration_seconds
+            total_cost_usdc += cost_usdc
+            payload.append({
+                "prompt": job["prompt"],
+                "duration_seconds": duration_seconds,
+                "style": style,
+                "style_id": STYLE_IDS[style],
+                "estimated_cost_usdc": cost_usdc,
+            })
+
+        error, data, body = await _request_video(
+            _GENERATE_BATCH_PATH,
+            user_id,
+            orjson.dumps({"jobs": payload}),
+            total_cost_usdc,
+            _BATCH_STILL_PROCESSING,
+        )
+        if error is not None:
+            return error
+
+        # A raw video body can't be matched up with several jobs
+        if data is not None:
+            return _ERR_BATCH_RAW_VIDEO
+
+        data = orjson.loads(body)
+        _remember_balance(user_id, data)
+        returned = data.get("videos") or []
+        videos = [
+            {
+                "video_url": video.get("video_url"),
+                "thumbnail_url": video.get("thumbnail_url"),
+                "duration_seconds": job["duration_seconds"],
+                "style": job["style"],
+                "cost_gas": video.get("cost_gas"),
+                "purchase_id": video.get("purchase_id"),
+                "status": "ready",
+            }
+            for job, video in zip(payload, returned)
+        ]
+        if len(videos) != len(payload):
+            # Jobs the backend dropped are reported as failed and left out of cost_usdc
+            failed = [
+                {
+                    "prompt": job["prompt"],
+                    "duration_seconds": job["duration_seconds"],
+                    "style": job["style"],
+                    "status": "failed",
+                }
+                for job in payload[len(videos):]
+            ]
+            return orjson.dumps({
+                "success": False,
+                "error": f"Only {len(videos)} of {len(payload)} videos were generated",
+                "videos": videos + failed,
+                "cost_gas": data.get("cost_gas"),
+                "cost_usdc": sum(job["estimated_cost_usdc"] for job in payload[:len(videos)]),
+                "status": "partial",
+                "message": (
+                    f"Only {len(videos)} of {len(payload)} videos were generated; "
+                    f"the remaining {len(failed)} failed. "
+                    f"Cost: {data.get('cost_gas', '?')} GAS."
+                ),
+            }).decode()
+
+        return orjson.dumps({
+            "success": True,
+            "videos": videos,
+            "cost_gas": data.get("cost_gas"),
+            "cost_usdc": total_cost_usdc,
+            "status": "ready",
+            "message": (
+                f"{len(videos)} videos generated successfully! "
+                f"Cost: {data.get('cost_gas', '?')} GAS."
+            ),
+        }).decode()